@@ -1,3 +1,4 @@
+import codecs
 import threading
 import weakref
 from functools import wraps
@@ -377,6 +378,7 @@ class Connection(object):
         self._set_guc('client_encoding', encoding)
         self._encoding = encoding
         self._py_enc = pyenc
+        self._py_dec = codecs.getdecoder(pyenc)
 
     @property
     def notifies(self):
@@ -750,6 +752,7 @@ class Connection(object):
         client_encoding = self.get_parameter_status('client_encoding')
         self._encoding = _enc.normalize(client_encoding)
         self._py_enc = _enc.encodings[self._encoding]
+        self._py_dec = codecs.getdecoder(self._py_enc)
 
     def _get_equote(self):
         ret = libpq.PQparameterStatus(
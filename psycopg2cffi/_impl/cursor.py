@@ -403,7 +403,7 @@ class Cursor(object):
 
         """
         cast = self._get_cast(oid)
-        return cast.cast(s, self, None)
+        return cast(s, self, None)
 
     def mogrify(self, query, vars=None):
         """Return the the querystring with the vars binded.
@@ -624,6 +624,19 @@ class Cursor(object):
 
         self._withhold = bool(value)
 
+    @property
+    def tzinfo_factory(self):
+        return self._tzinfo_factory
+
+    @tzinfo_factory.setter
+    def tzinfo_factory(self, value):
+        self._tzinfo_factory = value
+        # Cache of tzinfo objects by offset in minutes, filled by the
+        # timestamp typecasters.  A result set almost always carries a
+        # single distinct timezone, but objects built by a previous
+        # factory must not survive a rebind.
+        self._tz_cache = {}
+
     @property
     def scrollable(self):
         return self._scrollable
@@ -779,7 +792,10 @@ class Cursor(object):
                 else:
                     prec = scale = None
 
-                casts.append(self._get_cast(ftype))
+                if libpq.PQfformat(self._pgres, i):
+                    casts.append(self._get_binary_cast(ftype))
+                else:
+                    casts.append(self._get_cast(ftype))
                 description.append(Column(
                     name=ffi.string(libpq.PQfname(self._pgres, i)),
                     type_code=ftype,
@@ -852,15 +868,24 @@ class Cursor(object):
             is_tuple = True
 
         # Fill it
+        pgres = self._pgres
+        casts = self._casts
+        parse_string = typecasts.parse_string
+        typecast = typecasts.typecast
         n = self._nfields
         for i in xrange(n):
-            if libpq.PQgetisnull(self._pgres, row_num, i):
+            if libpq.PQgetisnull(pgres, row_num, i):
                 row[i] = None
             else:
-                length = libpq.PQgetlength(self._pgres, row_num, i)
+                length = libpq.PQgetlength(pgres, row_num, i)
                 val = ffi.buffer(
-                        libpq.PQgetvalue(self._pgres, row_num, i), length)[:]
-                row[i] = typecasts.typecast(self._casts[i], val, length, self)
+                        libpq.PQgetvalue(pgres, row_num, i), length)[:]
+                cast = casts[i]
+                if cast.caster is parse_string:
+                    # the identity cast: store the fetched string as is
+                    row[i] = val
+                else:
+                    row[i] = typecast(cast, val, length, self)
 
         if is_tuple:
             return tuple(row)
@@ -873,11 +898,27 @@ class Cursor(object):
             try:
                 return self._conn._typecasts[oid]
             except KeyError:
+                if oid < typecasts._caster_array_size:
+                    cast = typecasts._caster_array[oid]
+                    if cast is not None:
+                        return cast
                 try:
                     return typecasts.string_types[oid]
                 except KeyError:
                     return typecasts.string_types[705]
 
+    def _get_binary_cast(self, oid):
+        """Return the cast for a column fetched in binary format
+
+        Types without a registered binary caster are returned as raw
+        bytes.
+
+        """
+        try:
+            return typecasts.binary_types[oid]
+        except KeyError:
+            return typecasts.STRING
+
 
 def _combine_cmd_params(cmd, params, conn):
     """Combine the command string and params"""
@@ -125,6 +125,7 @@ extern int PQntuples(const PGresult *res);
 extern int PQnfields(const PGresult *res);
 extern char *PQfname(const PGresult *res, int field_num);
 extern Oid PQftype(const PGresult *res, int field_num);
+extern int PQfformat(const PGresult *res, int field_num);
 extern int PQfsize(const PGresult *res, int field_num);
 extern int PQfmod(const PGresult *res, int field_num);
 extern int PQgetisnull(const PGresult *res, int tup_num, int field_num);
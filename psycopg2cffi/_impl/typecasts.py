@@ -1,18 +1,57 @@
 import re
 import decimal
 import datetime
+import struct
+import threading
 from time import localtime
 
 from psycopg2cffi._impl.libpq import libpq, ffi
 from psycopg2cffi._impl.exceptions import DataError
 
 
-string_types = {}
+# Dense OID -> Type table mirroring the globally registered entries of
+# string_types: all builtin OIDs are small, so the cast for a column can be
+# fetched with a list index instead of a dict probe.
+_caster_array_size = 2048
+_caster_array = [None] * _caster_array_size
+
+
+class _GlobalTypecasts(dict):
+    """The global OID -> Type registry
+
+    string_types is public (psycopg2cffi.extensions.string_types) and
+    casters are de-registered by deleting or popping entries from it
+    directly, so every mutation has to keep the dense _caster_array
+    mirror above in sync.
+
+    """
+    def __setitem__(self, oid, type_obj):
+        dict.__setitem__(self, oid, type_obj)
+        if oid < _caster_array_size:
+            _caster_array[oid] = type_obj
+
+    def __delitem__(self, oid):
+        dict.__delitem__(self, oid)
+        if oid < _caster_array_size:
+            _caster_array[oid] = None
+
+    def pop(self, oid, *args):
+        value = dict.pop(self, oid, *args)
+        if oid < _caster_array_size:
+            _caster_array[oid] = None
+        return value
+
+
+string_types = _GlobalTypecasts()
 
 binary_types = {}
 
 
 class Type(object):
+    # Type objects are created once per OID but called once per cell:
+    # __slots__ keeps the attribute loads in cast() off the instance dict.
+    __slots__ = ('name', 'values', 'caster', 'py_caster')
+
     def __init__(self, name, values, caster=None, py_caster=None):
         self.name = name
         self.values = values
@@ -22,12 +61,14 @@ class Type(object):
     def __eq__(self, other):
         return other in self.values
 
-    def cast(self, value, cursor=None, length=None):
+    def __call__(self, value, cursor=None, length=None):
         if self.py_caster is not None:
             return self.py_caster(value, cursor)
         return self.caster(value, length, cursor)
 
-    __call__ = cast
+    # the caster object of a column is exposed as cursor.description and
+    # psycopg2 documents calling it via .cast() as well
+    cast = __call__
 
 
 def register_type(type_obj, scope=None):
@@ -57,7 +98,7 @@ def new_array_type(values, name, baseobj):
 
 
 def typecast(caster, value, length, cursor):
-    return caster.cast(value, cursor, length)
+    return caster(value, cursor, length)
 
 
 def parse_unknown(value, length, cursor):
@@ -71,29 +112,44 @@ def parse_string(value, length, cursor):
     return value
 
 
-def parse_longinteger(value, length, cursor):
-    return long(value) if value is not None else None
+# The numeric casters bind their converter as a default argument: a local
+# load instead of a global (or module attribute) lookup per cell.
+
+def parse_longinteger(value, length, cursor, _long=long):
+    return _long(value) if value is not None else None
+
 
+def parse_integer(value, length, cursor, _int=int):
+    return _int(value) if value is not None else None
 
-def parse_integer(value, length, cursor):
-    return int(value) if value is not None else None
 
+def parse_float(value, length, cursor, _float=float):
+    return _float(value) if value is not None else None
 
-def parse_float(value, length, cursor):
-    return float(value) if value is not None else None
 
+def parse_decimal(value, length, cursor, _decimal=decimal.Decimal):
+    return _decimal(value) if value is not None else None
 
-def parse_decimal(value, length, cursor):
-    return decimal.Decimal(value) if value is not None else None
+
+# Reusable scratch for the PQunescapeBytea output length: ffi.new mallocs
+# and registers a destructor per call, which is measurable churn over many
+# bytea cells.  Per thread, since the GIL may be released between the
+# libpq call and the read of the length.
+_bytea_scratch = threading.local()
 
 
 def parse_binary(value, length, cursor):
     if value is None:
         return None
 
-    to_length = ffi.new('size_t *')
-    s = libpq.PQunescapeBytea(
-            ffi.new('unsigned char[]', str(value)), to_length)
+    try:
+        to_length = _bytea_scratch.len_ptr
+    except AttributeError:
+        to_length = _bytea_scratch.len_ptr = ffi.new('size_t *')
+    # cffi passes the bytes of value to the unsigned char * argument
+    # directly; copying them into a freshly allocated cffi array first
+    # would double the memory traffic for large bytea values
+    s = libpq.PQunescapeBytea(value, to_length)
     try:
         res = buffer(ffi.buffer(s, to_length[0])[:])
     finally:
@@ -110,6 +166,22 @@ def parse_boolean(value, length, cursor):
     return value[0] == "t" if value is not None else None
 
 
+# Characters with a special meaning inside an array token: a quote, an
+# escape, or a (potential) end of token.
+_re_array_special = re.compile(r'["\\,}]')
+
+# Direct per-element converters for the builtin scalar casters.  Arrays are
+# homogeneous, so parse_array binds one of these at construction time and
+# skips the typecast()/Type.cast dispatch on every element.
+_array_item_fast_casts = {
+    parse_string: lambda value: value,
+    parse_integer: int,
+    parse_longinteger: long,
+    parse_float: float,
+    parse_boolean: lambda value: value[0] == 't',
+}
+
+
 class parse_array(object):
     """Parse an array of a items using an configurable caster for the items
 
@@ -122,10 +194,31 @@ class parse_array(object):
         '{{"meeting", "lunch"}, {"training", "presentation"}}'
 
     """
+    __slots__ = ('_caster', '_fast_cast')
+
     def __init__(self, caster):
         self._caster = caster
-
-    def cast(self, value, length, cursor):
+        self._fast_cast = _array_item_fast_casts.get(
+            getattr(caster, 'caster', None))
+
+    def _bind_item_cast(self, cursor):
+        """Bind the element conversion for one array
+
+        Arrays are homogeneous: resolve the Type.cast dispatch here, once,
+        instead of branching on py_caster again for every element.
+
+        """
+        fast_cast = self._fast_cast
+        if fast_cast is not None:
+            return fast_cast
+        caster = self._caster
+        py_caster = caster.py_caster
+        if py_caster is not None:
+            return lambda value: py_caster(value, cursor)
+        caster_fn = caster.caster
+        return lambda value: caster_fn(value, len(value), cursor)
+
+    def __call__(self, value, length, cursor):
         if value is None:
             return None
 
@@ -133,65 +226,182 @@ class parse_array(object):
         if not (len(s) >= 2 and  s[0] == "{" and s[-1] == "}"):
             raise DataError("malformed array")
 
+        # postgres opens with a second brace only for multi-dimensional
+        # arrays; the overwhelmingly common one-dimensional case is
+        # parsed with a flat loop that carries no dimension stack
+        if s[1] == '{':
+            return self._cast_nd(s, cursor)
+        return self._cast_1d(s, cursor)
+
+    def _cast_1d(self, s, cursor):
+        """Parse a one-dimensional array"""
+        caster = self._caster
+        item_cast = self._bind_item_cast(cursor)
+        find = s.find
+
         i = 1
         array = []
+        array_append = array.append
+        value_length = len(s) - 1
+        while i < value_length:
+            c = s[i]
+            if c == ',' or c == ' ':
+                i += 1
+            elif c == '}':
+                # would close the outer array before its end
+                raise DataError("unbalanced braces in array")
+            elif c == '{':
+                # nested after all (postgres never produces this, but the
+                # nd parser accepts it): start over with the general loop
+                return self._cast_nd(s, cursor)
+            else:
+                # ',' is by far the most common token terminator, so try
+                # it first: find() scans for it at C speed, and the 'in'
+                # checks below verify in bulk that nothing special occurs
+                # before it.  This handles unquoted tokens (all of numeric
+                # arrays, most string arrays) with one find and one slice.
+                j = find(',', i, value_length)
+                if j < 0:
+                    j = value_length
+                str_buf = s[i:j]
+                if '"' not in str_buf and '\\' not in str_buf and \
+                        '}' not in str_buf:
+                    i = j
+                else:
+                    str_buf, i = self._scan_token(s, i, value_length)
+
+                # compare against the spelling postgres emits first;
+                # only a mixed-case 'null' pays the lower() allocation
+                if len(str_buf) == 4 and (str_buf == 'NULL' or (
+                        (str_buf[0] == 'n' or str_buf[0] == 'N') and
+                        str_buf.lower() == 'null')):
+                    val = typecast(caster, None, 0, cursor)
+                else:
+                    val = item_cast(str_buf)
+                array_append(val)
+        return array
+
+    def _cast_nd(self, s, cursor):
+        """Parse an array of arbitrary (up to 16) dimensions"""
+        # hoist the bound methods used on every iteration out of the
+        # loop; array_append is rebound whenever the current array changes
+        caster = self._caster
+        item_cast = self._bind_item_cast(cursor)
+        find = s.find
+
+        i = 1
+        array = []
+        array_append = array.append
         stack = [array]
         value_length = len(s) - 1
         while i < value_length:
-            if s[i] == '{':
+            c = s[i]
+            if c == '{':
                 sub_array = []
-                array.append(sub_array)
+                array_append(sub_array)
                 stack.append(sub_array)
                 if len(stack) > 16:
                     raise DataError("excessive array dimensions")
 
                 array = sub_array
+                array_append = array.append
                 i += 1
-            elif s[i] == '}':
+            elif c == '}':
                 stack.pop()
                 if not stack:
                     raise DataError("unbalanced braces in array")
                 array = stack[-1]
+                array_append = array.append
                 i += 1
-            elif s[i] in ', ':
+            elif c == ',' or c == ' ':
                 i += 1
             else:
-                # Number of quotes, this will always be 0 or 2 (int vs str)
-                quotes = 0
-
-                # Whether or not the next char should be escaped
-                escape_char = False
-
-                buf = []
-                while i < value_length:
-                    if not escape_char:
-                        if s[i] == '"':
-                            quotes += 1
-                        elif s[i] == '\\':
-                            escape_char = True
-                        elif quotes % 2 == 0 and (s[i] == '}' or s[i] == ','):
-                            break
-                        else:
-                            buf.append(s[i])
-                    else:
-                        escape_char = False
-                        buf.append(s[i])
-
-                    i += 1
-
-                str_buf = ''.join(buf)
-                if len(str_buf) == 4 and str_buf.lower() == 'null':
-                    val = typecast(self._caster, None, 0, cursor)
+                # ',' is by far the most common token terminator, so try
+                # it first: find() scans for it at C speed, and the 'in'
+                # checks below verify in bulk that nothing special occurs
+                # before it.  This handles unquoted tokens (all of numeric
+                # arrays, most string arrays) with one find and one slice.
+                j = find(',', i, value_length)
+                if j < 0:
+                    j = value_length
+                str_buf = s[i:j]
+                if '"' not in str_buf and '\\' not in str_buf and \
+                        '}' not in str_buf:
+                    i = j
+                else:
+                    str_buf, i = self._scan_token(s, i, value_length)
+
+                # compare against the spelling postgres emits first;
+                # only a mixed-case 'null' pays the lower() allocation
+                if len(str_buf) == 4 and (str_buf == 'NULL' or (
+                        (str_buf[0] == 'n' or str_buf[0] == 'N') and
+                        str_buf.lower() == 'null')):
+                    val = typecast(caster, None, 0, cursor)
                 else:
-                    val = typecast(self._caster, str_buf, len(str_buf), cursor)
-                array.append(val)
+                    val = item_cast(str_buf)
+                array_append(val)
         return stack[-1]
 
-    __call__ = cast
+    def _scan_token(self, s, i, value_length,
+            search=_re_array_special.search):
+        """Scan a token containing quotes or escapes
+
+        Jumps from one special character to the next and copies the plain
+        chunks in between wholesale.  Returns the token and the position
+        of its terminating delimiter.
+
+        """
+        start = i
+        buf = None
+
+        # Number of quotes, this will always be 0 or 2 (int vs str)
+        quotes = 0
+
+        end = value_length
+        while i < value_length:
+            match = search(s, i, value_length)
+            if match is None:
+                break
+            j = match.start()
+            c = s[j]
+            if c != '"' and c != '\\' and quotes % 2 == 0:
+                # an unquoted ',' or '}' terminates the token
+                end = j
+                break
+            if buf is None:
+                buf = [s[start:j]]
+            else:
+                buf.append(s[i:j])
+            if c == '"':
+                quotes += 1
+                i = j + 1
+            elif c == '\\':
+                if j + 1 < value_length:
+                    buf.append(s[j + 1])
+                i = j + 2
+            else:
+                # a ',' or '}' between quotes is plain content
+                buf.append(c)
+                i = j + 1
+
+        if buf is None:
+            return s[start:end], end
+        buf.append(s[i:end])
+        return ''.join(buf), end
 
 def parse_unicode(value, length, cursor):
-    """Decode the given value with the connection encoding"""
-    return value.decode(cursor._conn._py_enc) if value is not None else None
+    """Decode the given value with the connection encoding
+
+    The decoder is cached on the connection: looking the codec up by
+    name through str.decode costs a registry query per cell.
+
+    """
+    return cursor._conn._py_dec(value)[0] if value is not None else None
+
+
+# Multipliers scaling a second fraction of a given length to microseconds,
+# replacing the '0'-padding string arithmetic done per row before.
+_micros_mult = (1000000, 100000, 10000, 1000, 100, 10, 1)
 
 
 def _parse_time_to_args(value, cursor):
@@ -200,34 +410,61 @@ def _parse_time_to_args(value, cursor):
     The given value is in the format of `16:28:09.506488+01`
 
     """
-    hour, minute, second = value.split(':', 2)
+    # the time itself is fixed-width: 'HH:MM:SS'
+    hour = int(value[:2])
+    minute = int(value[3:5])
+    second = int(value[6:8])
 
-    sign = 0
+    micros = 0
     tzinfo = None
-    timezone = None
-    if '-' in second:
-        sign = -1
-        second, timezone = second.split('-')
-    elif '+' in second:
-        sign = 1
-        second, timezone = second.split('+')
-
-    if not cursor.tzinfo_factory is None and sign:
-        parts = timezone.split(':')
-        tz_min = 60 * int(parts[0])
-        if len(parts) > 1:
-            tz_min += int(parts[1])
-        if len(parts) > 2 and int(parts[2]) >= 30:
-            tz_min += 1
-        tzinfo = cursor.tzinfo_factory(sign * tz_min)
-
-    if '.' in second:
-        second, frac = second.split('.')
-        micros = int((frac + ('0' * (6 - len(frac))))[:6])
-    else:
-        micros = 0
-
-    return int(hour), int(minute), int(second), micros, tzinfo
+    rest = value[8:]
+    if rest:
+        # scan the tail once for a timezone sign instead of testing for
+        # '-' and '+' separately and splitting again on the one found
+        sign = 0
+        k = rest.find('-')
+        if k >= 0:
+            sign = -1
+        else:
+            k = rest.find('+')
+            if k >= 0:
+                sign = 1
+
+        if sign:
+            # the timezone is 'HH', 'HH:MM' or 'HH:MM:SS'; anything
+            # trailing it (the ' BC' of a BC timestamptz, say) must not
+            # be swallowed, or a wrong naive datetime would come back
+            timezone = rest[k + 1:]
+            rest = rest[:k]
+            if len(timezone) not in (2, 5, 8) \
+                    or timezone[2:3] not in ('', ':') \
+                    or timezone[5:6] not in ('', ':'):
+                raise ValueError("invalid time: '%s'" % value)
+            # parse the offset even with no factory to consume it: the
+            # int() calls reject garbage digits regardless
+            tz_min = 60 * int(timezone[:2])
+            if len(timezone) > 3:
+                tz_min += int(timezone[3:5])
+            if len(timezone) > 6 and int(timezone[6:8]) >= 30:
+                tz_min += 1
+            if cursor.tzinfo_factory is not None:
+                tz_min *= sign
+                # reuse the tzinfo built for this offset by an earlier
+                # row rather than calling the factory again
+                tzinfo = cursor._tz_cache.get(tz_min)
+                if tzinfo is None:
+                    tzinfo = cursor.tzinfo_factory(tz_min)
+                    cursor._tz_cache[tz_min] = tzinfo
+
+        if rest:
+            # what is left is the '.ffffff' second fraction
+            if rest[0] != '.':
+                raise ValueError("invalid time: '%s'" % value)
+            frac = rest[1:]
+            if frac:
+                micros = int(frac[:6]) * _micros_mult[min(len(frac), 6)]
+
+    return hour, minute, second, micros, tzinfo
 
 
 def parse_datetime(value, length, cursor):
@@ -239,13 +476,13 @@ def parse_datetime(value, length, cursor):
         return datetime.datetime.min
 
     try:
-        date, time = value.split(' ')
-        date_args = date.split('-')
+        # the ISO output format is fixed-width up to the seconds:
+        # 'YYYY-MM-DD HH:MM:SS[.ffffff][+TZ]'
         return datetime.datetime(
-                int(date_args[0]),
-                int(date_args[1]),
-                int(date_args[2]),
-                *_parse_time_to_args(time, cursor))
+                int(value[:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                *_parse_time_to_args(value[11:], cursor))
     except (TypeError, ValueError):
         if value.endswith('BC'):
             raise ValueError('BC dates not supported')
@@ -260,11 +497,13 @@ def parse_date(value, length, cursor):
     elif value == '-infinity':
         return datetime.date.min
 
+    if value.endswith('BC'):
+        raise ValueError('BC dates not supported')
+
     try:
-        return datetime.date(*[int(x) for x in value.split('-')])
+        # the ISO output format is fixed-width: 'YYYY-MM-DD'
+        return datetime.date(int(value[:4]), int(value[5:7]), int(value[8:10]))
     except (TypeError, ValueError):
-        if value.endswith('BC'):
-            raise ValueError('BC dates not supported')
         raise DataError("bad datetime: '%s'" % value)
 
 
@@ -279,23 +518,16 @@ def parse_time(value, length, cursor):
 
 
 _re_interval = re.compile(r"""
-    (?:(-?\+?\d+)\sy\w+\s?)?    # year
-    (?:(-?\+?\d+)\sm\w+\s?)?    # month
-    (?:(-?\+?\d+)\sd\w+\s?)?    # day
-    (?:(-?\+?)(\d+):(\d+):(\d+) # +/- hours:mins:secs
-        (?:\.(\d+))?)?          # second fraction
+    \A                           # fail fast on a non-matching prefix
+    (?:([+-]?\d+)\syears?\s?)?   # year
+    (?:([+-]?\d+)\smons?\s?)?    # month
+    (?:([+-]?\d+)\sdays?\s?)?    # day
+    (?:([+-]?)(\d+):(\d+):(\d+)  # +/- hours:mins:secs
+        (?:\.(\d+))?)?           # second fraction
     """, re.VERBOSE)
 
-def parse_interval(value, length, cursor):
-    """Typecast an interval to a datetime.timedelta instance.
-
-    For example, the value '2 years 1 mon 3 days 10:01:39.100' is converted
-    to `datetime.timedelta(763, 36099, 100)`.
-
-    """
-    if value is None:
-        return None
-
+def _parse_interval_fallback(value):
+    """Parse an interval the linear parser did not recognize."""
     m = _re_interval.match(value)
     if not m:
         raise ValueError("failed to parse interval: '%s'" % value)
@@ -311,7 +543,7 @@ def parse_interval(value, length, cursor):
     if hours is not None:
         secs = int(hours) * 3600 + int(mins) * 60 + int(secs)
         if frac is not None:
-            micros = int((frac + ('0' * (6 - len(frac))))[:6])
+            micros = int(frac[:6]) * _micros_mult[min(len(frac), 6)]
         else:
             micros = 0
 
@@ -324,6 +556,155 @@ def parse_interval(value, length, cursor):
     return datetime.timedelta(days, secs, micros)
 
 
+def parse_interval(value, length, cursor):
+    """Typecast an interval to a datetime.timedelta instance.
+
+    For example, the value '2 years 1 mon 3 days 10:01:39.100' is converted
+    to `datetime.timedelta(763, 36099, 100)`.
+
+    The value is parsed linearly as '[N years] [N mons] [N days] [HH:MM:SS
+    [.frac]]'; anything with a different shape falls back to the interval
+    regex.
+
+    """
+    if value is None:
+        return None
+
+    try:
+        days = secs = micros = 0
+        parts = value.split(' ')
+
+        time_part = parts[-1]
+        if ':' in time_part:
+            parts = parts[:-1]
+            sign = 1
+            if time_part[0] == '-':
+                sign = -1
+                time_part = time_part[1:]
+            elif time_part[0] == '+':
+                time_part = time_part[1:]
+            hours, mins, time_part = time_part.split(':')
+            if '.' in time_part:
+                time_part, frac = time_part.split('.')
+                if frac:
+                    micros = sign * \
+                        int(frac[:6]) * _micros_mult[min(len(frac), 6)]
+            secs = sign * (
+                int(hours) * 3600 + int(mins) * 60 + int(time_part))
+
+        # what remains is '<n> <unit>' pairs
+        for k in range(0, len(parts) - 1, 2):
+            unit = parts[k + 1][:1]
+            if unit == 'd':
+                days += int(parts[k])
+            elif unit == 'm':
+                days += int(parts[k]) * 30
+            elif unit == 'y':
+                days += int(parts[k]) * 365
+
+        return datetime.timedelta(days, secs, micros)
+    except (TypeError, ValueError):
+        return _parse_interval_fallback(value)
+
+
+class InterningCaster(object):
+    """Memoize a caster, returning the same object for repeated raw values
+
+    Low-cardinality columns (dates, intervals) otherwise allocate an
+    identical object per row.  Only suitable for casters whose results
+    are immutable and do not depend on the cursor.  The cache is keyed
+    by the raw value and dropped wholesale when it reaches its size
+    limit.
+
+    """
+    __slots__ = ('_caster', '_size', '_cache')
+
+    def __init__(self, caster, size=4096):
+        self._caster = caster
+        self._size = size
+        self._cache = {}
+
+    def __call__(self, value, length, cursor):
+        if value is None:
+            return self._caster(value, length, cursor)
+        try:
+            return self._cache[value]
+        except KeyError:
+            result = self._caster(value, length, cursor)
+            cache = self._cache
+            if len(cache) >= self._size:
+                cache.clear()
+            cache[value] = result
+            return result
+
+
+# Casters for the binary result format (PQfformat() == 1).  These decode
+# the network representation directly - a big-endian load instead of an
+# ASCII round-trip - and are registered in binary_types below.
+
+_unpack_int2 = struct.Struct('!h').unpack
+_unpack_int4 = struct.Struct('!i').unpack
+_unpack_int8 = struct.Struct('!q').unpack
+_unpack_float4 = struct.Struct('!f').unpack
+_unpack_float8 = struct.Struct('!d').unpack
+
+# binary dates and timestamps count from the postgres epoch
+_pg_epoch_date = datetime.date(2000, 1, 1)
+_pg_epoch_datetime = datetime.datetime(2000, 1, 1)
+
+
+def parse_integer_bin(value, length, cursor):
+    """Typecast a binary int2/int4 value, told apart by their width"""
+    if value is None:
+        return None
+    if len(value) == 2:
+        return _unpack_int2(value)[0]
+    return _unpack_int4(value)[0]
+
+
+def parse_longinteger_bin(value, length, cursor):
+    return _unpack_int8(value)[0] if value is not None else None
+
+
+def parse_float_bin(value, length, cursor):
+    """Typecast a binary float4/float8 value, told apart by their width"""
+    if value is None:
+        return None
+    if len(value) == 4:
+        return _unpack_float4(value)[0]
+    return _unpack_float8(value)[0]
+
+
+def parse_boolean_bin(value, length, cursor):
+    return value != '\x00' if value is not None else None
+
+
+def parse_binary_bin(value, length, cursor):
+    """Typecast a binary bytea value: already raw, no unescaping needed"""
+    return buffer(value) if value is not None else None
+
+
+def parse_date_bin(value, length, cursor):
+    """Typecast a binary date value: days from the postgres epoch"""
+    if value is None:
+        return None
+    return _pg_epoch_date + datetime.timedelta(days=_unpack_int4(value)[0])
+
+
+def parse_datetime_bin(value, length, cursor):
+    """Typecast a binary timestamp value.
+
+    Assumes a server with integer datetimes (the default since 8.4): the
+    value is microseconds from the postgres epoch.  timestamptz values
+    arrive in UTC and are returned without tzinfo.
+
+    """
+    if value is None:
+        return None
+    return _pg_epoch_datetime + datetime.timedelta(
+            microseconds=_unpack_int8(value)[0])
+
+
 def Date(year, month, day):
     from psycopg2cffi.extensions.adapters import DateTime
     date = datetime.date(year, month, day)
@@ -347,6 +728,14 @@ def _default_type(name, oids, caster):
     return type_obj
 
 
+def _default_binary_type(name, oids, caster):
+    """Shortcut to register internal binary-format types"""
+    type_obj = Type(name, oids, caster)
+    for value in type_obj.values:
+        binary_types[value] = type_obj
+    return type_obj
+
+
 # DB API 2.0 types
 BINARY = _default_type('BINARY', [17], parse_binary)
 DATETIME = _default_type('DATETIME',  [1114, 1184, 704, 1186], parse_datetime)
@@ -356,11 +745,12 @@ STRING = _default_type('STRING', [19, 18, 25, 1042, 1043], parse_string)
 
 # Register the basic typecasters
 BOOLEAN = _default_type('BOOLEAN', [16], parse_boolean)
-DATE = _default_type('DATE', [1082], parse_date)
+DATE = _default_type('DATE', [1082], InterningCaster(parse_date))
 DECIMAL = _default_type('DECIMAL', [1700], parse_decimal)
 FLOAT = _default_type('FLOAT', [701, 700], parse_float)
 INTEGER = _default_type('INTEGER', [23, 21], parse_integer)
-INTERVAL = _default_type('INTERVAL', [704, 1186], parse_interval)
+INTERVAL = _default_type('INTERVAL', [704, 1186],
+    InterningCaster(parse_interval))
 LONGINTEGER = _default_type('LONGINTEGER', [20], parse_longinteger)
 TIME = _default_type('TIME', [1083, 1266], parse_time)
 UNKNOWN = _default_type('UNKNOWN', [705], parse_unknown)
@@ -395,3 +785,15 @@ TIMEARRAY = _default_type(
 UNICODE = Type('UNICODE', [19, 18, 25, 1042, 1043], parse_unicode)
 UNICODEARRAY = Type('UNICODEARRAY', [1002, 1003, 1009, 1014, 1015],
     parse_array(UNICODE))
+
+# Binary-format types, consulted by the cursor for columns reported with
+# PQfformat() == 1; text-format columns are unaffected
+BINARY_BINARY = _default_binary_type('BINARY', [17], parse_binary_bin)
+BOOLEAN_BINARY = _default_binary_type('BOOLEAN', [16], parse_boolean_bin)
+DATE_BINARY = _default_binary_type('DATE', [1082], parse_date_bin)
+DATETIME_BINARY = _default_binary_type(
+    'DATETIME', [1114, 1184], parse_datetime_bin)
+FLOAT_BINARY = _default_binary_type('FLOAT', [700, 701], parse_float_bin)
+INTEGER_BINARY = _default_binary_type('INTEGER', [21, 23], parse_integer_bin)
+LONGINTEGER_BINARY = _default_binary_type(
+    'LONGINTEGER', [20], parse_longinteger_bin)